@@ -1,28 +1,72 @@
 """The Terneo/Welrok thermostat integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
+    MANUFACTURER,
     CONF_SERIAL,
     CONF_DEVICE_TYPE,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DEVICE_TYPE_OLD,
+    REQUEST_REFRESH_COOLDOWN,
 )
 from .thermostat import TerneoThermostat
 
+if TYPE_CHECKING:
+    from .number import PatchWriter
+
 _LOGGER = logging.getLogger(__name__)
 
+
+@dataclass
+class TerneoRuntimeData:
+    """Runtime data stored on the config entry."""
+
+    coordinator: TerneoCoordinator
+    thermostat: TerneoThermostat
+    device_info: DeviceInfo
+    # Set up by the number platform
+    patch_writer: PatchWriter | None = None
+
+
+TerneoConfigEntry = ConfigEntry[TerneoRuntimeData]
+
+
+class TerneoCoordinator(DataUpdateCoordinator):
+    """Coordinator polling a thermostat, slower while it is idle."""
+
+    def __init__(self, *args, base_interval: timedelta, **kwargs) -> None:
+        """Initialize the coordinator at the base interval."""
+        super().__init__(*args, update_interval=base_interval, **kwargs)
+        self.base_interval = base_interval
+
+    @callback
+    def async_publish_state(self, thermostat: TerneoThermostat) -> None:
+        """Publish the state left by a successful write.
+
+        The write may have woken an idle device, so polling goes back to
+        the base interval.
+        """
+        self.update_interval = self.base_interval
+        self.async_set_updated_data(thermostat.snapshot())
+
 # Service schemas
 SERVICE_SET_FLOOR_LIMITS = "set_floor_limits"
 SERVICE_SET_AIR_LIMITS = "set_air_limits"
@@ -52,7 +96,7 @@ PLATFORMS: list[Platform] = [
 ]
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: TerneoConfigEntry) -> bool:
     """Set up Terneo thermostat from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
@@ -61,52 +105,91 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     timeout = entry.options.get("timeout", DEFAULT_TIMEOUT)
 
     # Create thermostat instance
+    thermostat = TerneoThermostat(
+        serial_number=entry.data[CONF_SERIAL],
+        host=entry.data[CONF_HOST],
+        device_type=entry.data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OLD),
+        timeout=timeout,
+    )
     try:
-        thermostat = await hass.async_add_executor_job(
-            lambda: TerneoThermostat(
-                serial_number=entry.data[CONF_SERIAL],
-                host=entry.data[CONF_HOST],
-                device_type=entry.data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OLD),
-                timeout=timeout,
-            )
-        )
+        await hass.async_add_executor_job(thermostat.connect)
     except Exception as err:
         _LOGGER.error("Failed to connect to Terneo thermostat: %s", err)
+        thermostat.close()
         return False
 
     # Create update coordinator
+    base_interval = timedelta(seconds=scan_interval)
+    previous_state = None
+
     async def async_update_data():
         """Fetch data from API."""
+        nonlocal previous_state
         try:
             success = await hass.async_add_executor_job(thermostat.update)
-            if not success:
-                raise UpdateFailed("Failed to update thermostat data")
-            return thermostat
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        if not success:
+            raise UpdateFailed("Failed to update thermostat data")
+        state = thermostat.snapshot()
+
+        # Poll at the configured rate while the device is active, back off
+        # while nothing changes. Heating keeps the base rate so the energy
+        # counters get sampled often enough.
+        changed = previous_state is None or (
+            state.relay_state != previous_state.relay_state
+            or state.setpoint != previous_state.setpoint
+        )
+        if changed or state.relay_state:
+            coordinator.update_interval = base_interval
+        elif state.power_on:
+            coordinator.update_interval = base_interval * 2
+        else:
+            coordinator.update_interval = base_interval * 4
 
-    coordinator = DataUpdateCoordinator(
+        previous_state = state
+        return state
+
+    coordinator = TerneoCoordinator(
         hass,
         _LOGGER,
         name=f"Terneo {entry.data[CONF_SERIAL]}",
         update_method=async_update_data,
-        update_interval=timedelta(seconds=scan_interval),
+        base_interval=base_interval,
+        # Coalesce refresh requests issued by back-to-back writes into one poll
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+        ),
     )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-
-    # Store coordinator and thermostat
-    hass.data[DOMAIN][entry.entry_id] = {
-        "coordinator": coordinator,
-        "thermostat": thermostat,
-    }
+    # Fetch initial data, setup is retried with a new thermostat on failure
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        thermostat.close()
+        raise
+
+    # Store coordinator, thermostat and the device info shared by all entities
+    entry.runtime_data = TerneoRuntimeData(
+        coordinator=coordinator,
+        thermostat=thermostat,
+        device_info=build_device_info(thermostat, entry),
+    )
 
     # Setup platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    try:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        thermostat.close()
+        raise
+
+    # Only fully set up entries are served by the services
+    hass.data[DOMAIN].setdefault("_entries", []).append((coordinator, thermostat))
 
-    # Register services
-    await async_register_services(hass)
+    # Register services once for all entries
+    if not hass.data[DOMAIN].get("_services_registered"):
+        await async_register_services(hass)
+        hass.data[DOMAIN]["_services_registered"] = True
 
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -114,6 +197,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def build_device_info(thermostat: TerneoThermostat, entry: ConfigEntry) -> DeviceInfo:
+    """Build the device info shared by all entities of a thermostat."""
+    return DeviceInfo(
+        identifiers=frozenset(((DOMAIN, thermostat.sn),)),
+        name=entry.title,
+        manufacturer=MANUFACTURER,
+        model=thermostat.model,
+        serial_number=thermostat.sn,
+    )
+
+
+@callback
+def async_enabled_descriptions(
+    hass: HomeAssistant,
+    platform: Platform,
+    thermostat: TerneoThermostat,
+    descriptions: tuple,
+) -> list:
+    """Return the descriptions whose entities are not disabled in the registry.
+    
+    Enabling a disabled entity reloads the config entry, so skipped
+    entities are created again once they are needed.
+    """
+    registry = er.async_get(hass)
+    enabled = []
+    for description in descriptions:
+        entity_id = registry.async_get_entity_id(
+            platform, DOMAIN, thermostat.unique_id(description.key)
+        )
+        if entity_id is not None and registry.async_get(entity_id).disabled:
+            continue
+        enabled.append(description)
+    return enabled
+
+
+async def _async_push_states(entries: list[tuple], results: list[bool]) -> None:
+    """Publish locally updated state, refreshing devices whose write failed."""
+    refreshes = []
+    for (coordinator, thermostat), success in zip(entries, results):
+        if success:
+            coordinator.async_publish_state(thermostat)
+        else:
+            refreshes.append(coordinator.async_request_refresh())
+    await asyncio.gather(*refreshes)
+
+
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register integration services."""
     
@@ -122,65 +251,76 @@ async def async_register_services(hass: HomeAssistant) -> None:
         lower = call.data["lower"]
         upper = call.data["upper"]
         
-        for entry_id, data in hass.data[DOMAIN].items():
-            thermostat = data["thermostat"]
-            await hass.async_add_executor_job(
-                thermostat.set_floor_limits, lower, upper
+        entries = list(hass.data[DOMAIN]["_entries"])
+        results = await asyncio.gather(
+            *(
+                hass.async_add_executor_job(therm.set_floor_limits, lower, upper)
+                for coord, therm in entries
             )
-            await data["coordinator"].async_request_refresh()
+        )
+        await _async_push_states(entries, results)
 
     async def handle_set_air_limits(call: ServiceCall) -> None:
         """Handle set_air_limits service call."""
         lower = call.data["lower"]
         upper = call.data["upper"]
         
-        for entry_id, data in hass.data[DOMAIN].items():
-            thermostat = data["thermostat"]
-            if thermostat.is_new_version:
-                await hass.async_add_executor_job(
-                    thermostat.set_air_limits, lower, upper
-                )
-                await data["coordinator"].async_request_refresh()
-
-    # Only register services if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_FLOOR_LIMITS):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_FLOOR_LIMITS,
-            handle_set_floor_limits,
-            schema=SERVICE_FLOOR_LIMITS_SCHEMA,
+        entries = [
+            (coord, therm)
+            for coord, therm in hass.data[DOMAIN]["_entries"]
+            if therm.is_new_version
+        ]
+        results = await asyncio.gather(
+            *(
+                hass.async_add_executor_job(therm.set_air_limits, lower, upper)
+                for coord, therm in entries
+            )
         )
+        await _async_push_states(entries, results)
 
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_AIR_LIMITS):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_AIR_LIMITS,
-            handle_set_air_limits,
-            schema=SERVICE_AIR_LIMITS_SCHEMA,
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_FLOOR_LIMITS,
+        handle_set_floor_limits,
+        schema=SERVICE_FLOOR_LIMITS_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_AIR_LIMITS,
+        handle_set_air_limits,
+        schema=SERVICE_AIR_LIMITS_SCHEMA,
+    )
 
     async def handle_restart(call: ServiceCall) -> None:
         """Handle restart service call."""
-        for entry_id, data in hass.data[DOMAIN].items():
-            thermostat = data["thermostat"]
-            await hass.async_add_executor_job(thermostat.restart)
-
-    if not hass.services.has_service(DOMAIN, SERVICE_RESTART):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_RESTART,
-            handle_restart,
+        await asyncio.gather(
+            *(
+                hass.async_add_executor_job(therm.restart)
+                for coord, therm in hass.data[DOMAIN]["_entries"]
+            )
         )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTART,
+        handle_restart,
+    )
+
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: TerneoConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = entry.runtime_data
+        if data.patch_writer is not None:
+            # Entities are gone, send what they queued while the session is open
+            await data.patch_writer.async_shutdown()
+        hass.data[DOMAIN]["_entries"].remove((data.coordinator, data.thermostat))
+        data.thermostat.close()
 
     return unload_ok
@@ -6,10 +6,11 @@ import logging
 from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from . import TerneoConfigEntry
 from .thermostat import TerneoThermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,15 +18,17 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TerneoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terneo button entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    thermostat = data["thermostat"]
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    thermostat = data.thermostat
 
-    async_add_entities([TerneoRestartButton(coordinator, thermostat, entry)])
+    async_add_entities(
+        [TerneoRestartButton(coordinator, thermostat, entry, data.device_info)]
+    )
 
 
 class TerneoRestartButton(CoordinatorEntity, ButtonEntity):
@@ -41,20 +44,15 @@ class TerneoRestartButton(CoordinatorEntity, ButtonEntity):
         coordinator,
         thermostat: TerneoThermostat,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button entity."""
         super().__init__(coordinator)
         self._thermostat = thermostat
         self._entry = entry
         
-        self._attr_unique_id = f"{thermostat.sn}_restart"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, thermostat.sn)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "OZ" if thermostat.is_new_version else "OZ (Legacy)",
-            "serial_number": thermostat.sn,
-        }
+        self._attr_unique_id = thermostat.unique_id("restart")
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -13,10 +14,12 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, ControlType, OperationMode
+from . import TerneoConfigEntry
+from .const import ControlType, OperationMode
 from .thermostat import TerneoThermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,24 +31,37 @@ SUPPORT_FLAGS = (
     | ClimateEntityFeature.PRESET_MODE
 )
 
-HVAC_MODES = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO]
+HVAC_MODES = (HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO)
 
 PRESET_SCHEDULE = "schedule"
 PRESET_MANUAL = "manual"
-PRESET_MODES = [PRESET_SCHEDULE, PRESET_MANUAL]
+PRESET_MODES = (PRESET_SCHEDULE, PRESET_MANUAL)
+
+# Plain int copies of the enum values compared in hot state properties
+_MODE_SCHEDULE = int(OperationMode.SCHEDULE)
+_CTRL_FLOOR = int(ControlType.FLOOR)
+_AIR_CONTROL_TYPES = (int(ControlType.AIR), int(ControlType.AIR_WITH_FLOOR_LIMIT))
+
+CONTROL_TYPE_NAMES = {
+    ControlType.FLOOR: "floor",
+    ControlType.AIR: "air",
+    ControlType.AIR_WITH_FLOOR_LIMIT: "air_with_floor_limit",
+}
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TerneoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terneo climate entity from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    thermostat = data["thermostat"]
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    thermostat = data.thermostat
 
-    async_add_entities([TerneoClimateEntity(coordinator, thermostat, entry)])
+    async_add_entities(
+        [TerneoClimateEntity(coordinator, thermostat, entry, data.device_info)]
+    )
 
 
 class TerneoClimateEntity(CoordinatorEntity, ClimateEntity):
@@ -64,74 +80,73 @@ class TerneoClimateEntity(CoordinatorEntity, ClimateEntity):
         coordinator,
         thermostat: TerneoThermostat,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the climate entity."""
         super().__init__(coordinator)
         self._thermostat = thermostat
         self._entry = entry
         
-        self._attr_unique_id = f"{thermostat.sn}_climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, thermostat.sn)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "OZ" if thermostat.is_new_version else "OZ (Legacy)",
-            "serial_number": thermostat.sn,
-        }
+        # Device version never changes, control type is refreshed per update
+        self._is_new_version = thermostat.is_new_version
+        self._control_type = coordinator.data.control_type or _CTRL_FLOOR
+        
+        self._attr_unique_id = thermostat.unique_id("climate")
+        self._attr_device_info = device_info
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
+        state = self.coordinator.data
         # Return air temperature for new version if control type is air
-        if self._thermostat.is_new_version:
-            control_type = self._thermostat.control_type
-            if control_type in [ControlType.AIR, ControlType.AIR_WITH_FLOOR_LIMIT]:
-                return self._thermostat.air_temperature
-        return self._thermostat.floor_temperature
+        if self._is_new_version and self._control_type in _AIR_CONTROL_TYPES:
+            return state.air_temperature
+        return state.floor_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        return self._thermostat.setpoint
+        return self.coordinator.data.setpoint
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature."""
-        control_type = self._thermostat.control_type or ControlType.FLOOR
+        state = self.coordinator.data
         
-        if self._thermostat.is_new_version and control_type != ControlType.FLOOR:
-            limit = self._thermostat.lower_air_limit
-            return float(limit) if limit is not None else 5.0
+        if self._is_new_version and self._control_type != _CTRL_FLOOR:
+            limit = state.lower_air_limit
+            return limit if limit is not None else 5.0
         
-        limit = self._thermostat.lower_limit
-        return float(limit) if limit is not None else 5.0
+        limit = state.lower_limit
+        return limit if limit is not None else 5.0
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        control_type = self._thermostat.control_type or ControlType.FLOOR
+        state = self.coordinator.data
         
-        if self._thermostat.is_new_version and control_type != ControlType.FLOOR:
-            limit = self._thermostat.upper_air_limit
-            return float(limit) if limit is not None else 35.0
+        if self._is_new_version and self._control_type != _CTRL_FLOOR:
+            limit = state.upper_air_limit
+            return limit if limit is not None else 35.0
         
-        limit = self._thermostat.upper_limit
-        return float(limit) if limit is not None else 45.0
+        limit = state.upper_limit
+        return limit if limit is not None else 45.0
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        mode = self._thermostat.mode
+        state = self.coordinator.data
+        mode = state.mode
         
-        if mode == -1 or not self._thermostat.power_on:
+        if mode == -1 or not state.power_on:
             return HVACMode.OFF
         
         # Check if in cooling mode
-        if self._thermostat.cooling_mode:
+        if state.cooling_mode:
             return HVACMode.COOL
         
         # Schedule mode = AUTO, Manual mode = HEAT
-        if mode == OperationMode.SCHEDULE:
+        if mode == _MODE_SCHEDULE:
             return HVACMode.AUTO
         
         return HVACMode.HEAT
@@ -139,11 +154,12 @@ class TerneoClimateEntity(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_action(self) -> HVACAction:
         """Return current HVAC action."""
-        if not self._thermostat.power_on or self._thermostat.mode == -1:
+        state = self.coordinator.data
+        if not state.power_on or state.mode == -1:
             return HVACAction.OFF
         
-        if self._thermostat.relay_state:
-            if self._thermostat.cooling_mode:
+        if state.relay_state:
+            if state.cooling_mode:
                 return HVACAction.COOLING
             return HVACAction.HEATING
         
@@ -152,107 +168,119 @@ class TerneoClimateEntity(CoordinatorEntity, ClimateEntity):
     @property
     def preset_mode(self) -> str | None:
         """Return current preset mode."""
-        mode = self._thermostat.mode
+        mode = self.coordinator.data.mode
         
-        if mode == OperationMode.SCHEDULE:
+        if mode == _MODE_SCHEDULE:
             return PRESET_SCHEDULE
         return PRESET_MANUAL
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
+        state = self.coordinator.data
         attrs = {
             "serial_number": self._thermostat.sn,
-            "device_type": "new" if self._thermostat.is_new_version else "old",
+            "device_type": "new" if self._is_new_version else "old",
             "control_type": self._get_control_type_name(),
-            "relay_state": self._thermostat.relay_state,
-            "floor_temperature": self._thermostat.floor_temperature,
+            "relay_state": state.relay_state,
+            "floor_temperature": state.floor_temperature,
         }
         
-        if self._thermostat.is_new_version:
-            attrs["air_temperature"] = self._thermostat.air_temperature
+        if self._is_new_version:
+            attrs["air_temperature"] = state.air_temperature
         
-        if self._thermostat.hysteresis is not None:
-            attrs["hysteresis"] = self._thermostat.hysteresis
+        if state.hysteresis is not None:
+            attrs["hysteresis"] = state.hysteresis
         
-        if self._thermostat.power_watts is not None:
-            attrs["power_watts"] = self._thermostat.power_watts
+        if state.power_watts is not None:
+            attrs["power_watts"] = state.power_watts
         
         return attrs
 
     def _get_control_type_name(self) -> str:
         """Get human-readable control type name."""
-        control_type = self._thermostat.control_type
-        if control_type == ControlType.FLOOR:
-            return "floor"
-        elif control_type == ControlType.AIR:
-            return "air"
-        elif control_type == ControlType.AIR_WITH_FLOOR_LIMIT:
-            return "air_with_floor_limit"
-        return "unknown"
+        return CONTROL_TYPE_NAMES.get(self.coordinator.data.control_type, "unknown")
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
         
-        await self.hass.async_add_executor_job(
+        success = await self.hass.async_add_executor_job(
             self._thermostat.set_setpoint, temperature
         )
-        await self.coordinator.async_request_refresh()
+        await self._async_push_state(success)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
+        success = False
         if hvac_mode == HVACMode.OFF:
-            await self.hass.async_add_executor_job(self._thermostat.turn_off)
+            success = await self.hass.async_add_executor_job(self._thermostat.turn_off)
         elif hvac_mode == HVACMode.HEAT:
-            await self.hass.async_add_executor_job(self._thermostat.turn_on)
-            await self.hass.async_add_executor_job(
-                self._thermostat.set_cooling_mode, False
-            )
-            await self.hass.async_add_executor_job(
-                self._thermostat.set_mode, OperationMode.MANUAL
+            success = await self.hass.async_add_executor_job(
+                partial(
+                    self._thermostat.apply_state,
+                    power=True,
+                    cooling=False,
+                    mode=OperationMode.MANUAL,
+                )
             )
         elif hvac_mode == HVACMode.COOL:
-            await self.hass.async_add_executor_job(self._thermostat.turn_on)
-            await self.hass.async_add_executor_job(
-                self._thermostat.set_cooling_mode, True
-            )
-            await self.hass.async_add_executor_job(
-                self._thermostat.set_mode, OperationMode.MANUAL
+            success = await self.hass.async_add_executor_job(
+                partial(
+                    self._thermostat.apply_state,
+                    power=True,
+                    cooling=True,
+                    mode=OperationMode.MANUAL,
+                )
             )
         elif hvac_mode == HVACMode.AUTO:
-            await self.hass.async_add_executor_job(self._thermostat.turn_on)
-            await self.hass.async_add_executor_job(
-                self._thermostat.set_mode, OperationMode.SCHEDULE
+            success = await self.hass.async_add_executor_job(
+                partial(
+                    self._thermostat.apply_state,
+                    power=True,
+                    mode=OperationMode.SCHEDULE,
+                )
             )
         
-        await self.coordinator.async_request_refresh()
+        await self._async_push_state(success)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         if preset_mode == PRESET_SCHEDULE:
-            await self.hass.async_add_executor_job(
+            success = await self.hass.async_add_executor_job(
                 self._thermostat.set_mode, OperationMode.SCHEDULE
             )
         else:
-            await self.hass.async_add_executor_job(
+            success = await self.hass.async_add_executor_job(
                 self._thermostat.set_mode, OperationMode.MANUAL
             )
         
-        await self.coordinator.async_request_refresh()
+        await self._async_push_state(success)
 
     async def async_turn_on(self) -> None:
         """Turn on the thermostat."""
-        await self.hass.async_add_executor_job(self._thermostat.turn_on)
-        await self.coordinator.async_request_refresh()
+        success = await self.hass.async_add_executor_job(self._thermostat.turn_on)
+        await self._async_push_state(success)
 
     async def async_turn_off(self) -> None:
         """Turn off the thermostat."""
-        await self.hass.async_add_executor_job(self._thermostat.turn_off)
-        await self.coordinator.async_request_refresh()
+        success = await self.hass.async_add_executor_job(self._thermostat.turn_off)
+        await self._async_push_state(success)
+
+    async def _async_push_state(self, success: bool) -> None:
+        """Publish the locally updated state after a write.
+        
+        The thermostat updates its cached state on a successful write, so
+        no extra poll is needed. A failed write schedules a refresh instead.
+        """
+        if success:
+            self.coordinator.async_publish_state(self._thermostat)
+        else:
+            await self.coordinator.async_request_refresh()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._control_type = self.coordinator.data.control_type or _CTRL_FLOOR
         self.async_write_ha_state()
@@ -11,6 +11,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -19,40 +20,50 @@ from .const import (
     DEVICE_TYPE_OLD,
     DEVICE_TYPE_NEW,
     DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_SERIAL): str,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("scan_interval", default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=300)
+        ),
+        vol.Optional("timeout", default=DEFAULT_TIMEOUT): vol.All(
+            vol.Coerce(int), vol.Range(min=3, max=120)
+        ),
+        vol.Optional("show_advanced_sensors", default=False): bool,
+    }
+)
+
 
 async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     host = data[CONF_HOST]
     serial = data[CONF_SERIAL]
     
-    base_url = f"http://{host}"
-    
-    # Try to connect and get device info
-    try:
-        response = await hass.async_add_executor_job(
-            lambda: requests.get(f"{base_url}/api.html", timeout=5)
-        )
-        if response.status_code != 200:
-            raise CannotConnect("Cannot connect to device")
-    except requests.RequestException as err:
-        _LOGGER.error("Connection error: %s", err)
-        raise CannotConnect("Cannot connect to device") from err
-    
-    # Try to get device parameters and detect version
+    return await hass.async_add_executor_job(_probe_device, host, serial)
+
+
+def _probe_device(host: str, serial: str) -> dict[str, Any]:
+    """Probe the device and detect its version."""
+    # Get device parameters and detect version in a single request
     try:
-        response = await hass.async_add_executor_job(
-            lambda: requests.post(
-                f"{base_url}/api.cgi",
-                json={"cmd": 1, "sn": serial},
-                timeout=5
-            )
+        response = requests.post(
+            f"http://{host}/api.cgi",
+            json={"cmd": 1, "sn": serial},
+            timeout=5
         )
-        result = response.json()
+        result = json_loads(response.content)
         
         if "sn" not in result:
             raise CannotConnect("Invalid device response - check serial number")
@@ -63,10 +74,10 @@ async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict
         
         # Detect device type by checking parameters
         # New version has parameters like 4 (manualAir), 6 (awayAir), etc.
-        params = {p[0]: p for p in result.get("par", [])}
+        param_ids = {p[0] for p in result.get("par", ())}
         
         # Check for new version specific parameters
-        has_air_sensor = 4 in params or 6 in params or 33 in params
+        has_air_sensor = not param_ids.isdisjoint((4, 6, 33))
         
         device_type = DEVICE_TYPE_NEW if has_air_sensor else DEVICE_TYPE_OLD
         
@@ -77,8 +88,8 @@ async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict
         }
         
     except requests.RequestException as err:
-        _LOGGER.error("Error getting device info: %s", err)
-        raise CannotConnect("Cannot get device info") from err
+        _LOGGER.error("Connection error: %s", err)
+        raise CannotConnect("Cannot connect to device") from err
     except (KeyError, ValueError) as err:
         _LOGGER.error("Invalid response from device: %s", err)
         raise CannotConnect("Invalid device response") from err
@@ -128,12 +139,7 @@ class TerneoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_SERIAL): str,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -199,20 +205,7 @@ class TerneoOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        "scan_interval",
-                        default=self.config_entry.options.get("scan_interval", 30),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
-                    vol.Optional(
-                        "timeout",
-                        default=self.config_entry.options.get("timeout", DEFAULT_TIMEOUT),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=3, max=120)),
-                    vol.Optional(
-                        "show_advanced_sensors",
-                        default=self.config_entry.options.get("show_advanced_sensors", False),
-                    ): bool,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
             ),
         )
@@ -16,6 +16,10 @@ DEVICE_TYPE_NEW = "new"  # oz с датчиком воздуха (от июня
 DEFAULT_NAME = "Terneo"
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_TIMEOUT = 5
+MIN_REQUEST_INTERVAL = 1.0  # Seconds the device needs between requests
+PARAMS_TTL = 300  # Seconds before device settings are fetched again
+REQUEST_REFRESH_COOLDOWN = 0.3  # Seconds to coalesce refresh requests
+PARAM_PATCH_COOLDOWN = 0.1  # Seconds to coalesce queued parameter writes
 
 # API Commands
 CMD_GET_PARAMS = 1
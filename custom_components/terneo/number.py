@@ -1,8 +1,11 @@
 """Number platform for Terneo/Welrok thermostat."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
 from typing import Callable
 
 from homeassistant.components.number import (
@@ -11,13 +14,15 @@ from homeassistant.components.number import (
     NumberEntityDescription,
     NumberMode,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature, UnitOfPower, UnitOfTime
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfPower, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from . import TerneoConfigEntry, async_enabled_descriptions
+from .const import PARAM_PATCH_COOLDOWN, DataType, ParamNum
 from .thermostat import TerneoThermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,202 +35,193 @@ class TerneoNumberEntityDescription(NumberEntityDescription):
     value_fn: Callable[[TerneoThermostat], float | None]
     set_fn: Callable[[TerneoThermostat, float], bool]
     new_version_only: bool = False
+    # set_fn only queues the value, related writes are sent in one request
+    coalesce: bool = False
+
+
+def _queue_param(
+    param_num: ParamNum, data_type: DataType
+) -> Callable[[TerneoThermostat, float], bool]:
+    """Return a setter that queues a single parameter write."""
+    return lambda t, v: t.queue_patch(param_num, data_type, str(int(v)))
+
+
+# Templates for the common kinds of number entities; keyword arguments
+# passed at the call site override the template values.
+_temperature_box = partial(
+    TerneoNumberEntityDescription,
+    device_class=NumberDeviceClass.TEMPERATURE,
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    native_step=1,
+    mode=NumberMode.BOX,
+)
+_minutes_box = partial(
+    TerneoNumberEntityDescription,
+    native_unit_of_measurement=UnitOfTime.MINUTES,
+    native_step=1,
+    mode=NumberMode.BOX,
+)
+_slider = partial(
+    TerneoNumberEntityDescription,
+    native_step=1,
+    mode=NumberMode.SLIDER,
+)
 
 
 NUMBER_DESCRIPTIONS: tuple[TerneoNumberEntityDescription, ...] = (
-    TerneoNumberEntityDescription(
+    _slider(
         key="brightness",
         translation_key="brightness",
         name="Display Brightness",
         icon="mdi:brightness-6",
         native_min_value=0,
         native_max_value=9,
-        native_step=1,
-        mode=NumberMode.SLIDER,
-        value_fn=lambda t: t.brightness,
+        value_fn=attrgetter("brightness"),
         set_fn=lambda t, v: t.set_brightness(int(v)),
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="hysteresis",
         translation_key="hysteresis",
         name="Hysteresis",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=0.5,
         native_max_value=10.0,
         native_step=0.1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.hysteresis,
+        value_fn=attrgetter("hysteresis"),
         set_fn=lambda t, v: t.set_hysteresis(v),
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="floor_correction",
         translation_key="floor_correction",
         name="Floor Sensor Correction",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=-12.7,
         native_max_value=12.7,
         native_step=0.1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.floor_correction,
+        value_fn=attrgetter("floor_correction"),
         set_fn=lambda t, v: t.set_floor_correction(v),
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="air_correction",
         translation_key="air_correction",
         name="Air Sensor Correction",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=-12.7,
         native_max_value=12.7,
         native_step=0.1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.air_correction,
+        value_fn=attrgetter("air_correction"),
         set_fn=lambda t, v: t.set_air_correction(v),
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _slider(
         key="prop_koef",
         translation_key="prop_koef",
         name="Proportional Coefficient",
         icon="mdi:percent",
         native_min_value=0,
         native_max_value=30,
-        native_step=1,
-        mode=NumberMode.SLIDER,
-        value_fn=lambda t: t.prop_koef,
+        value_fn=attrgetter("prop_koef"),
         set_fn=lambda t, v: t.set_prop_koef(int(v)),
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="upper_floor_limit",
         translation_key="upper_floor_limit",
         name="Max Floor Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=10,
         native_max_value=45,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.upper_limit,
-        set_fn=lambda t, v: t.set_floor_limits(t.lower_limit or 5, int(v)),
+        value_fn=attrgetter("upper_limit"),
+        set_fn=_queue_param(ParamNum.UPPER_LIMIT, DataType.INT8),
+        coalesce=True,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="lower_floor_limit",
         translation_key="lower_floor_limit",
         name="Min Floor Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=5,
         native_max_value=40,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.lower_limit,
-        set_fn=lambda t, v: t.set_floor_limits(int(v), t.upper_limit or 45),
+        value_fn=attrgetter("lower_limit"),
+        set_fn=_queue_param(ParamNum.LOWER_LIMIT, DataType.INT8),
+        coalesce=True,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="upper_air_limit",
         translation_key="upper_air_limit",
         name="Max Air Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=10,
         native_max_value=35,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.upper_air_limit,
-        set_fn=lambda t, v: t.set_air_limits(t.lower_air_limit or 5, int(v)),
+        value_fn=attrgetter("upper_air_limit"),
+        set_fn=_queue_param(ParamNum.UPPER_AIR_LIMIT, DataType.INT8),
+        coalesce=True,
         new_version_only=True,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="lower_air_limit",
         translation_key="lower_air_limit",
         name="Min Air Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=5,
         native_max_value=30,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.lower_air_limit,
-        set_fn=lambda t, v: t.set_air_limits(int(v), t.upper_air_limit or 35),
+        value_fn=attrgetter("lower_air_limit"),
+        set_fn=_queue_param(ParamNum.LOWER_AIR_LIMIT, DataType.INT8),
+        coalesce=True,
         new_version_only=True,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="min_temp_advanced",
         translation_key="min_temp_advanced",
         name="Min Floor Limit (Air Mode)",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=0,
         native_max_value=40,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.min_temp_advanced,
-        set_fn=lambda t, v: t.set_advanced_floor_limits(int(v), t.max_temp_advanced or 45),
+        value_fn=attrgetter("min_temp_advanced"),
+        set_fn=_queue_param(ParamNum.MIN_TEMP_ADVANCED, DataType.INT8),
+        coalesce=True,
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="max_temp_advanced",
         translation_key="max_temp_advanced",
         name="Max Floor Limit (Air Mode)",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=5,
         native_max_value=45,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.max_temp_advanced,
-        set_fn=lambda t, v: t.set_advanced_floor_limits(t.min_temp_advanced or 0, int(v)),
+        value_fn=attrgetter("max_temp_advanced"),
+        set_fn=_queue_param(ParamNum.MAX_TEMP_ADVANCED, DataType.INT8),
+        coalesce=True,
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _minutes_box(
         key="ble_sensor_interval",
         translation_key="ble_sensor_interval",
         name="Wireless Sensor Interval",
         icon="mdi:bluetooth",
-        native_unit_of_measurement=UnitOfTime.MINUTES,
         native_min_value=1,
         native_max_value=60,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.ble_sensor_interval,
+        value_fn=attrgetter("ble_sensor_interval"),
         set_fn=lambda t, v: t.set_ble_sensor_interval(int(v)),
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="upper_warning_temp",
         translation_key="upper_warning_temp",
         name="Upper Warning Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=5,
         native_max_value=45,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.upper_warning_temp,
-        set_fn=lambda t, v: t.set_warning_temps(t.lower_warning_temp or 5, int(v)),
+        value_fn=attrgetter("upper_warning_temp"),
+        set_fn=_queue_param(ParamNum.UPPER_WARNING_TEMP, DataType.INT8),
+        coalesce=True,
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="lower_warning_temp",
         translation_key="lower_warning_temp",
         name="Lower Warning Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=0,
         native_max_value=40,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.lower_warning_temp,
-        set_fn=lambda t, v: t.set_warning_temps(int(v), t.upper_warning_temp or 35),
+        value_fn=attrgetter("lower_warning_temp"),
+        set_fn=_queue_param(ParamNum.LOWER_WARNING_TEMP, DataType.INT8),
+        coalesce=True,
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
@@ -239,102 +235,88 @@ NUMBER_DESCRIPTIONS: tuple[TerneoNumberEntityDescription, ...] = (
         native_max_value=7500,
         native_step=10,
         mode=NumberMode.BOX,
-        value_fn=lambda t: t.power_watts,
+        value_fn=attrgetter("power_watts"),
         set_fn=lambda t, v: t.set_power(int(v)),
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _minutes_box(
         key="night_bright_start",
         translation_key="night_bright_start",
         name="Night Mode Start",
         icon="mdi:weather-night",
-        native_unit_of_measurement=UnitOfTime.MINUTES,
         native_min_value=0,
         native_max_value=1439,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.night_bright_start,
-        set_fn=lambda t, v: t.set_night_brightness_time(int(v), t.night_bright_end or 480),
+        value_fn=attrgetter("night_bright_start"),
+        set_fn=_queue_param(ParamNum.NIGHT_BRIGHT_START, DataType.UINT16),
+        coalesce=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _minutes_box(
         key="night_bright_end",
         translation_key="night_bright_end",
         name="Night Mode End",
         icon="mdi:weather-sunny",
-        native_unit_of_measurement=UnitOfTime.MINUTES,
         native_min_value=0,
         native_max_value=1439,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.night_bright_end,
-        set_fn=lambda t, v: t.set_night_brightness_time(t.night_bright_start or 0, int(v)),
+        value_fn=attrgetter("night_bright_end"),
+        set_fn=_queue_param(ParamNum.NIGHT_BRIGHT_END, DataType.UINT16),
+        coalesce=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _slider(
         key="button_minus_cor",
         translation_key="button_minus_cor",
         name="Minus Button Sensitivity",
         icon="mdi:gesture-tap-button",
         native_min_value=-30,
         native_max_value=30,
-        native_step=1,
-        mode=NumberMode.SLIDER,
-        value_fn=lambda t: t.button_minus_cor,
-        set_fn=lambda t, v: t.set_button_corrections(int(v), t.button_menu_cor or 0, t.button_plus_cor or 0),
+        value_fn=attrgetter("button_minus_cor"),
+        set_fn=_queue_param(ParamNum.BUTTON_MINUS_COR, DataType.INT8),
+        coalesce=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _slider(
         key="button_menu_cor",
         translation_key="button_menu_cor",
         name="Menu Button Sensitivity",
         icon="mdi:gesture-tap-button",
         native_min_value=-30,
         native_max_value=30,
-        native_step=1,
-        mode=NumberMode.SLIDER,
-        value_fn=lambda t: t.button_menu_cor,
-        set_fn=lambda t, v: t.set_button_corrections(t.button_minus_cor or 0, int(v), t.button_plus_cor or 0),
+        value_fn=attrgetter("button_menu_cor"),
+        set_fn=_queue_param(ParamNum.BUTTON_MENU_COR, DataType.INT8),
+        coalesce=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _slider(
         key="button_plus_cor",
         translation_key="button_plus_cor",
         name="Plus Button Sensitivity",
         icon="mdi:gesture-tap-button",
         native_min_value=-30,
         native_max_value=30,
-        native_step=1,
-        mode=NumberMode.SLIDER,
-        value_fn=lambda t: t.button_plus_cor,
-        set_fn=lambda t, v: t.set_button_corrections(t.button_minus_cor or 0, t.button_menu_cor or 0, int(v)),
+        value_fn=attrgetter("button_plus_cor"),
+        set_fn=_queue_param(ParamNum.BUTTON_PLUS_COR, DataType.INT8),
+        coalesce=True,
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="away_floor_temperature",
         translation_key="away_floor_temperature",
         name="Away Floor Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=5,
         native_max_value=45,
-        native_step=1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.away_floor_temperature,
+        value_fn=attrgetter("away_floor_temperature"),
         set_fn=lambda t, v: t.set_away_temperature(v),
         entity_registry_enabled_default=False,
     ),
-    TerneoNumberEntityDescription(
+    _temperature_box(
         key="away_air_temperature",
         translation_key="away_air_temperature",
         name="Away Air Temperature",
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=5,
         native_max_value=35,
         native_step=0.1,
-        mode=NumberMode.BOX,
-        value_fn=lambda t: t.away_air_temperature,
+        value_fn=attrgetter("away_air_temperature"),
         set_fn=lambda t, v: t.set_away_temperature(t.away_floor_temperature or 5, v),
         new_version_only=True,
         entity_registry_enabled_default=False,
@@ -342,25 +324,122 @@ NUMBER_DESCRIPTIONS: tuple[TerneoNumberEntityDescription, ...] = (
 )
 
 
+# Old devices skip the new version only numbers
+_LEGACY_DESCRIPTIONS = tuple(
+    description for description in NUMBER_DESCRIPTIONS if not description.new_version_only
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TerneoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terneo number entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    thermostat = data["thermostat"]
-
-    entities = []
-    for description in NUMBER_DESCRIPTIONS:
-        # Skip new version only numbers for old devices
-        if description.new_version_only and not thermostat.is_new_version:
-            continue
-        
-        entities.append(TerneoNumberEntity(coordinator, thermostat, entry, description))
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    thermostat = data.thermostat
+    device_info = data.device_info
+
+    descriptions = async_enabled_descriptions(
+        hass,
+        Platform.NUMBER,
+        thermostat,
+        NUMBER_DESCRIPTIONS if thermostat.is_new_version else _LEGACY_DESCRIPTIONS,
+    )
+
+    patch_writer = data.patch_writer = PatchWriter(hass, coordinator, thermostat)
 
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            TerneoNumberEntity(
+                coordinator,
+                thermostat,
+                description,
+                device_info,
+                patch_writer,
+            )
+            for description in descriptions
+        ]
+    )
+
+
+class PatchWriter:
+    """Send queued parameter writes of a thermostat in one request.
+    
+    Writes of related numbers (e.g. min and max limits) issued close
+    together are merged into a single device request. A write queued
+    while a flush is running arms the timer again and goes out with the
+    next flush.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator,
+        thermostat: TerneoThermostat,
+    ) -> None:
+        """Initialize the patch writer."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._thermostat = thermostat
+        self._flushed: asyncio.Future[bool] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_write(self) -> None:
+        """Send the queued writes with the next flush and wait for it."""
+        if self._flushed is None:
+            self._flushed = self._hass.loop.create_future()
+        flushed = self._flushed
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(
+                PARAM_PATCH_COOLDOWN, self._async_on_timer
+            )
+        # Shield the shared future, other writes wait for it as well
+        if not await asyncio.shield(flushed):
+            raise HomeAssistantError("Failed to write settings to the thermostat")
+
+    async def async_shutdown(self) -> None:
+        """Send writes still waiting for the timer before the entry unloads."""
+        self._async_cancel_timer()
+        if self._flushed is not None or self._thermostat.has_pending_patch:
+            await self._async_flush()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel a scheduled flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    @callback
+    def _async_on_timer(self) -> None:
+        """Start the scheduled flush."""
+        self._timer = None
+        self._hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Send queued parameter writes to the device in one request."""
+        async with self._lock:
+            # Writes queued from here on wait for the next flush
+            flushed, self._flushed = self._flushed, None
+            if flushed is None and not self._thermostat.has_pending_patch:
+                return
+            
+            success = False
+            try:
+                success = await self._hass.async_add_executor_job(
+                    self._thermostat.flush_patch
+                )
+            finally:
+                if flushed is not None:
+                    flushed.set_result(success)
+            
+            if success:
+                self._coordinator.async_publish_state(self._thermostat)
+            else:
+                await self._coordinator.async_request_refresh()
 
 
 class TerneoNumberEntity(CoordinatorEntity, NumberEntity):
@@ -373,36 +452,38 @@ class TerneoNumberEntity(CoordinatorEntity, NumberEntity):
         self,
         coordinator,
         thermostat: TerneoThermostat,
-        entry: ConfigEntry,
         description: TerneoNumberEntityDescription,
+        device_info: DeviceInfo,
+        patch_writer: PatchWriter,
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
         self._thermostat = thermostat
-        self._entry = entry
+        self._patch_writer = patch_writer
         self.entity_description = description
         
-        self._attr_unique_id = f"{thermostat.sn}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, thermostat.sn)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "OZ" if thermostat.is_new_version else "OZ (Legacy)",
-            "serial_number": thermostat.sn,
-        }
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        return self.entity_description.value_fn(self._thermostat)
+        self._attr_unique_id = thermostat.unique_id(description.key)
+        self._attr_device_info = device_info
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._thermostat.available
+        # CoordinatorEntity overrides available, so serve the cached value
+        return self._attr_available
+
+    def _update_attrs(self) -> None:
+        """Cache the value and availability from the thermostat."""
+        self._attr_native_value = self.entity_description.value_fn(self._thermostat)
+        self._attr_available = self._thermostat.available
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
+        if self.entity_description.coalesce:
+            self.entity_description.set_fn(self._thermostat, value)
+            await self._patch_writer.async_write()
+            return
+        
         await self.hass.async_add_executor_job(
             self.entity_description.set_fn, self._thermostat, value
         )
@@ -411,4 +492,5 @@ class TerneoNumberEntity(CoordinatorEntity, NumberEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._update_attrs()
         self.async_write_ha_state()
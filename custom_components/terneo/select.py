@@ -6,50 +6,29 @@ from dataclasses import dataclass
 from typing import Callable
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, ControlType, SENSOR_TYPES
+from . import TerneoConfigEntry, async_enabled_descriptions
+from .const import ControlType, SENSOR_TYPES
 from .thermostat import TerneoThermostat
 
 _LOGGER = logging.getLogger(__name__)
 
 
-# Control type mappings
-CONTROL_TYPE_OPTIONS = {
-    "floor": ControlType.FLOOR,
-    "air": ControlType.AIR,
-    "air_with_floor_limit": ControlType.AIR_WITH_FLOOR_LIMIT,
-}
-
-CONTROL_TYPE_NAMES = {
-    ControlType.FLOOR: "floor",
-    ControlType.AIR: "air",
-    ControlType.AIR_WITH_FLOOR_LIMIT: "air_with_floor_limit",
-}
-
-# Sensor type mappings
-SENSOR_TYPE_OPTIONS = {
-    "4.7k": 0,
-    "6.8k": 1,
-    "10k": 2,
-    "12k": 3,
-    "15k": 4,
-    "33k": 5,
-    "47k": 6,
-}
-
-SENSOR_TYPE_NAMES = {
-    0: "4.7k",
-    1: "6.8k",
-    2: "10k",
-    3: "12k",
-    4: "15k",
-    5: "33k",
-    6: "47k",
-}
+# Control type names, indexed by ControlType value
+CONTROL_TYPE_NAMES = ("floor", "air", "air_with_floor_limit")
+
+# Sensor type names, indexed by sensor type value
+SENSOR_TYPE_NAMES = ("4.7k", "6.8k", "10k", "12k", "15k", "33k", "47k")
+
+# Option lists shared by all select entities
+_CONTROL_TYPE_OPTION_LIST = list(CONTROL_TYPE_NAMES)
+_LEGACY_CONTROL_TYPE_OPTION_LIST = [CONTROL_TYPE_NAMES[ControlType.FLOOR]]
+_SENSOR_TYPE_OPTION_LIST = list(SENSOR_TYPE_NAMES)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -66,40 +45,50 @@ def get_control_type_value(thermostat: TerneoThermostat) -> str | None:
     """Get current control type as string."""
     control_type = thermostat.control_type
     if control_type is not None:
-        return CONTROL_TYPE_NAMES.get(control_type, "floor")
+        if 0 <= control_type < len(CONTROL_TYPE_NAMES):
+            return CONTROL_TYPE_NAMES[control_type]
+        return "floor"
     return None
 
 
 def set_control_type_value(thermostat: TerneoThermostat, value: str) -> bool:
     """Set control type from string."""
-    control_type = CONTROL_TYPE_OPTIONS.get(value, ControlType.FLOOR)
+    try:
+        control_type = ControlType[value.upper()]
+    except KeyError:
+        control_type = ControlType.FLOOR
     return thermostat.set_control_type(control_type)
 
 
 def get_control_type_options(thermostat: TerneoThermostat) -> list[str]:
     """Get available control type options."""
     if thermostat.is_new_version:
-        return ["floor", "air", "air_with_floor_limit"]
-    return ["floor"]
+        return _CONTROL_TYPE_OPTION_LIST
+    return _LEGACY_CONTROL_TYPE_OPTION_LIST
 
 
 def get_sensor_type_value(thermostat: TerneoThermostat) -> str | None:
     """Get current sensor type as string."""
     sensor_type = thermostat.sensor_type
     if sensor_type is not None:
-        return SENSOR_TYPE_NAMES.get(sensor_type, "10k")
+        if 0 <= sensor_type < len(SENSOR_TYPE_NAMES):
+            return SENSOR_TYPE_NAMES[sensor_type]
+        return "10k"
     return None
 
 
 def set_sensor_type_value(thermostat: TerneoThermostat, value: str) -> bool:
     """Set sensor type from string."""
-    sensor_type = SENSOR_TYPE_OPTIONS.get(value, 2)  # Default to 10k
+    try:
+        sensor_type = SENSOR_TYPE_NAMES.index(value)
+    except ValueError:
+        sensor_type = 2  # Default to 10k
     return thermostat.set_sensor_type(sensor_type)
 
 
 def get_sensor_type_options(thermostat: TerneoThermostat) -> list[str]:
     """Get available sensor type options."""
-    return ["4.7k", "6.8k", "10k", "12k", "15k", "33k", "47k"]
+    return _SENSOR_TYPE_OPTION_LIST
 
 
 SELECT_DESCRIPTIONS: tuple[TerneoSelectEntityDescription, ...] = (
@@ -126,25 +115,48 @@ SELECT_DESCRIPTIONS: tuple[TerneoSelectEntityDescription, ...] = (
 )
 
 
+# Old devices skip the new version only selects
+_LEGACY_DESCRIPTIONS = tuple(
+    description for description in SELECT_DESCRIPTIONS if not description.new_version_only
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TerneoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terneo select entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    thermostat = data["thermostat"]
-
-    entities = []
-    for description in SELECT_DESCRIPTIONS:
-        # Skip new version only selects for old devices
-        if description.new_version_only and not thermostat.is_new_version:
-            continue
-        
-        entities.append(TerneoSelectEntity(coordinator, thermostat, entry, description))
-
-    async_add_entities(entities)
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    thermostat = data.thermostat
+    device_info = data.device_info
+
+    descriptions = async_enabled_descriptions(
+        hass,
+        Platform.SELECT,
+        thermostat,
+        SELECT_DESCRIPTIONS if thermostat.is_new_version else _LEGACY_DESCRIPTIONS,
+    )
+
+    # Options depend only on the device, resolve them once per setup
+    options_by_key = {
+        description.key: description.options_fn(thermostat)
+        for description in descriptions
+    }
+
+    async_add_entities(
+        [
+            TerneoSelectEntity(
+                coordinator,
+                thermostat,
+                description,
+                device_info,
+                options_by_key[description.key],
+            )
+            for description in descriptions
+        ]
+    )
 
 
 class TerneoSelectEntity(CoordinatorEntity, SelectEntity):
@@ -157,26 +169,18 @@ class TerneoSelectEntity(CoordinatorEntity, SelectEntity):
         self,
         coordinator,
         thermostat: TerneoThermostat,
-        entry: ConfigEntry,
         description: TerneoSelectEntityDescription,
+        device_info: DeviceInfo,
+        options: list[str],
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
         self._thermostat = thermostat
-        self._entry = entry
         self.entity_description = description
         
-        self._attr_unique_id = f"{thermostat.sn}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, thermostat.sn)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "OZ" if thermostat.is_new_version else "OZ (Legacy)",
-            "serial_number": thermostat.sn,
-        }
-        
-        # Set options dynamically
-        self._attr_options = description.options_fn(thermostat)
+        self._attr_unique_id = thermostat.unique_id(description.key)
+        self._attr_device_info = device_info
+        self._attr_options = options
 
     @property
     def current_option(self) -> str | None:
@@ -194,8 +198,3 @@ class TerneoSelectEntity(CoordinatorEntity, SelectEntity):
             self.entity_description.set_fn, self._thermostat, option
         )
         await self.coordinator.async_request_refresh()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
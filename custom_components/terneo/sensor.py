@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Callable
 
 from homeassistant.components.sensor import (
@@ -11,17 +12,20 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature, UnitOfPower, UnitOfTime, UnitOfEnergy
+from homeassistant.const import Platform, UnitOfTemperature, UnitOfPower, UnitOfTime, UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, SENSOR_TYPES
+from . import TerneoConfigEntry, async_enabled_descriptions
 from .thermostat import TerneoThermostat
 
 _LOGGER = logging.getLogger(__name__)
 
+# Heating state names, indexed by relay state
+_HEATING_STATES = ("Off", "On")
+
 
 @dataclass(frozen=True, kw_only=True)
 class TerneoSensorEntityDescription(SensorEntityDescription):
@@ -32,14 +36,6 @@ class TerneoSensorEntityDescription(SensorEntityDescription):
     new_version_only: bool = False
 
 
-def get_sensor_type_name(thermostat: TerneoThermostat) -> str | None:
-    """Get sensor type name."""
-    sensor_type = thermostat.sensor_type
-    if sensor_type is not None:
-        return SENSOR_TYPES.get(sensor_type, f"Unknown ({sensor_type})")
-    return None
-
-
 SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
     TerneoSensorEntityDescription(
         key="floor_temperature",
@@ -48,7 +44,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda t: t.floor_temperature,
+        value_fn=attrgetter("floor_temperature"),
     ),
     TerneoSensorEntityDescription(
         key="air_temperature",
@@ -57,7 +53,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda t: t.air_temperature,
+        value_fn=attrgetter("air_temperature"),
         new_version_only=True,
     ),
     TerneoSensorEntityDescription(
@@ -67,7 +63,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda t: t.setpoint,
+        value_fn=attrgetter("setpoint"),
     ),
     TerneoSensorEntityDescription(
         key="relay_on_time_limit",
@@ -75,7 +71,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         name="Continuous Heating Limit",
         icon="mdi:timer-alert",
         native_unit_of_measurement=UnitOfTime.HOURS,
-        value_fn=lambda t: t.relay_on_time_limit,
+        value_fn=attrgetter("relay_on_time_limit"),
         entity_registry_enabled_default=False,
     ),
     TerneoSensorEntityDescription(
@@ -83,7 +79,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         translation_key="sensor_type_display",
         name="Sensor Type",
         icon="mdi:thermometer",
-        value_fn=get_sensor_type_name,
+        value_fn=attrgetter("sensor_type_name"),
         entity_registry_enabled_default=False,
     ),
     TerneoSensorEntityDescription(
@@ -102,7 +98,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda t: t.manual_floor_temperature,
+        value_fn=attrgetter("manual_floor_temperature"),
         entity_registry_enabled_default=False,
     ),
     TerneoSensorEntityDescription(
@@ -112,7 +108,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda t: t.manual_air_temperature,
+        value_fn=attrgetter("manual_air_temperature"),
         new_version_only=True,
         entity_registry_enabled_default=False,
     ),
@@ -124,7 +120,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         icon="mdi:lightning-bolt",
-        value_fn=lambda t: t.heating_energy_kwh,
+        value_fn=attrgetter("heating_energy_kwh"),
         available_fn=lambda t: t.power_watts is not None and t.power_watts > 0,
     ),
     TerneoSensorEntityDescription(
@@ -135,7 +131,7 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfTime.HOURS,
         icon="mdi:timer",
-        value_fn=lambda t: t.heating_time_hours,
+        value_fn=attrgetter("heating_time_hours"),
         available_fn=lambda t: t.power_watts is not None and t.power_watts > 0,
     ),
     TerneoSensorEntityDescription(
@@ -154,30 +150,41 @@ SENSOR_DESCRIPTIONS: tuple[TerneoSensorEntityDescription, ...] = (
         translation_key="heating_active",
         name="Heating Active",
         icon="mdi:radiator",
-        value_fn=lambda t: "On" if t.relay_state else "Off",
+        value_fn=lambda t: _HEATING_STATES[bool(t.relay_state)],
     ),
 )
 
 
+# Old devices skip the new version only sensors
+_LEGACY_DESCRIPTIONS = tuple(
+    description for description in SENSOR_DESCRIPTIONS if not description.new_version_only
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TerneoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terneo sensor entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    thermostat = data["thermostat"]
-
-    entities = []
-    for description in SENSOR_DESCRIPTIONS:
-        # Skip new version only sensors for old devices
-        if description.new_version_only and not thermostat.is_new_version:
-            continue
-        
-        entities.append(TerneoSensorEntity(coordinator, thermostat, entry, description))
-
-    async_add_entities(entities)
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    thermostat = data.thermostat
+    device_info = data.device_info
+
+    descriptions = async_enabled_descriptions(
+        hass,
+        Platform.SENSOR,
+        thermostat,
+        SENSOR_DESCRIPTIONS if thermostat.is_new_version else _LEGACY_DESCRIPTIONS,
+    )
+
+    async_add_entities(
+        [
+            TerneoSensorEntity(coordinator, thermostat, description, device_info)
+            for description in descriptions
+        ]
+    )
 
 
 class TerneoSensorEntity(CoordinatorEntity, SensorEntity):
@@ -190,37 +197,37 @@ class TerneoSensorEntity(CoordinatorEntity, SensorEntity):
         self,
         coordinator,
         thermostat: TerneoThermostat,
-        entry: ConfigEntry,
         description: TerneoSensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor entity."""
         super().__init__(coordinator)
         self._thermostat = thermostat
-        self._entry = entry
         self.entity_description = description
         
-        self._attr_unique_id = f"{thermostat.sn}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, thermostat.sn)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "OZ" if thermostat.is_new_version else "OZ (Legacy)",
-            "serial_number": thermostat.sn,
-        }
-
-    @property
-    def native_value(self) -> float | int | str | None:
-        """Return the sensor value."""
-        return self.entity_description.value_fn(self._thermostat)
+        self._attr_unique_id = thermostat.unique_id(description.key)
+        self._attr_device_info = device_info
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self._thermostat.available:
-            return False
-        return self.entity_description.available_fn(self._thermostat)
+        # CoordinatorEntity overrides available, so serve the cached value
+        return self._attr_available
+
+    def _update_attrs(self) -> None:
+        """Cache the value and availability from the thermostat."""
+        self._attr_native_value = self.entity_description.value_fn(self._thermostat)
+        self._attr_available = (
+            self._thermostat.available
+            and self.entity_description.available_fn(self._thermostat)
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        previous = (self._attr_native_value, self._attr_available)
+        self._update_attrs()
+        # Most values rarely change, skip writing an identical state
+        if (self._attr_native_value, self._attr_available) != previous:
+            self.async_write_ha_state()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, Callable
 
 from homeassistant.components.switch import (
@@ -10,12 +11,13 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from . import TerneoConfigEntry, async_enabled_descriptions
 from .thermostat import TerneoThermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +39,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="power",
         name="Power",
         device_class=SwitchDeviceClass.SWITCH,
-        value_fn=lambda t: t.power_on,
+        value_fn=attrgetter("power_on"),
         turn_on_fn=lambda t: t.turn_on(),
         turn_off_fn=lambda t: t.turn_off(),
     ),
@@ -46,7 +48,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="children_lock",
         name="Children Lock",
         icon="mdi:lock-outline",
-        value_fn=lambda t: t.children_lock,
+        value_fn=attrgetter("children_lock"),
         turn_on_fn=lambda t: t.set_children_lock(True),
         turn_off_fn=lambda t: t.set_children_lock(False),
     ),
@@ -55,7 +57,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="cooling_mode",
         name="Cooling Mode",
         icon="mdi:snowflake",
-        value_fn=lambda t: t.cooling_mode,
+        value_fn=attrgetter("cooling_mode"),
         turn_on_fn=lambda t: t.set_cooling_mode(True),
         turn_off_fn=lambda t: t.set_cooling_mode(False),
     ),
@@ -64,7 +66,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="pre_control",
         name="Pre-heating",
         icon="mdi:radiator",
-        value_fn=lambda t: t.pre_control,
+        value_fn=attrgetter("pre_control"),
         turn_on_fn=lambda t: t.set_pre_control(True),
         turn_off_fn=lambda t: t.set_pre_control(False),
     ),
@@ -73,7 +75,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="use_night_brightness",
         name="Night Brightness",
         icon="mdi:brightness-4",
-        value_fn=lambda t: t.use_night_brightness,
+        value_fn=attrgetter("use_night_brightness"),
         turn_on_fn=lambda t: t.set_use_night_brightness(True),
         turn_off_fn=lambda t: t.set_use_night_brightness(False),
     ),
@@ -82,7 +84,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="window_open_control",
         name="Window Open Detection",
         icon="mdi:window-open-variant",
-        value_fn=lambda t: t.window_open_control,
+        value_fn=attrgetter("window_open_control"),
         turn_on_fn=lambda t: t.set_window_open_control(True),
         turn_off_fn=lambda t: t.set_window_open_control(False),
         new_version_only=True,
@@ -92,7 +94,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="nc_contact_control",
         name="Inverted Relay (NC)",
         icon="mdi:electric-switch",
-        value_fn=lambda t: t.nc_contact_control,
+        value_fn=attrgetter("nc_contact_control"),
         turn_on_fn=lambda t: t.set_nc_contact_control(True),
         turn_off_fn=lambda t: t.set_nc_contact_control(False),
         entity_registry_enabled_default=False,
@@ -102,7 +104,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="lan_block",
         name="LAN API Block",
         icon="mdi:lan-disconnect",
-        value_fn=lambda t: t.lan_block,
+        value_fn=attrgetter("lan_block"),
         turn_on_fn=lambda t: t.set_lan_block(True),
         turn_off_fn=lambda t: t.set_lan_block(False),
         entity_registry_enabled_default=False,
@@ -112,7 +114,7 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
         translation_key="cloud_block",
         name="Cloud Block",
         icon="mdi:cloud-off-outline",
-        value_fn=lambda t: t.cloud_block,
+        value_fn=attrgetter("cloud_block"),
         turn_on_fn=lambda t: t.set_cloud_block(True),
         turn_off_fn=lambda t: t.set_cloud_block(False),
         entity_registry_enabled_default=False,
@@ -120,25 +122,36 @@ SWITCH_DESCRIPTIONS: tuple[TerneoSwitchEntityDescription, ...] = (
 )
 
 
+# Old devices skip the new version only switches
+_LEGACY_DESCRIPTIONS = tuple(
+    description for description in SWITCH_DESCRIPTIONS if not description.new_version_only
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TerneoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terneo switch entities from a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    thermostat = data["thermostat"]
-
-    entities = []
-    for description in SWITCH_DESCRIPTIONS:
-        # Skip new version only switches for old devices
-        if description.new_version_only and not thermostat.is_new_version:
-            continue
-        
-        entities.append(TerneoSwitchEntity(coordinator, thermostat, entry, description))
-
-    async_add_entities(entities)
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    thermostat = data.thermostat
+    device_info = data.device_info
+
+    descriptions = async_enabled_descriptions(
+        hass,
+        Platform.SWITCH,
+        thermostat,
+        SWITCH_DESCRIPTIONS if thermostat.is_new_version else _LEGACY_DESCRIPTIONS,
+    )
+
+    async_add_entities(
+        [
+            TerneoSwitchEntity(coordinator, thermostat, description, device_info)
+            for description in descriptions
+        ]
+    )
 
 
 class TerneoSwitchEntity(CoordinatorEntity, SwitchEntity):
@@ -151,49 +164,52 @@ class TerneoSwitchEntity(CoordinatorEntity, SwitchEntity):
         self,
         coordinator,
         thermostat: TerneoThermostat,
-        entry: ConfigEntry,
         description: TerneoSwitchEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the switch entity."""
         super().__init__(coordinator)
         self._thermostat = thermostat
-        self._entry = entry
         self.entity_description = description
+        self._value_fn = description.value_fn
+        self._turn_on_fn = description.turn_on_fn
+        self._turn_off_fn = description.turn_off_fn
         
-        self._attr_unique_id = f"{thermostat.sn}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, thermostat.sn)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "OZ" if thermostat.is_new_version else "OZ (Legacy)",
-            "serial_number": thermostat.sn,
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if switch is on."""
-        return self.entity_description.value_fn(self._thermostat)
+        self._attr_unique_id = thermostat.unique_id(description.key)
+        self._attr_device_info = device_info
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._thermostat.available
+        # CoordinatorEntity overrides available, so serve the cached value
+        return self._attr_available
+
+    def _update_attrs(self) -> None:
+        """Cache the switch state and availability from the thermostat."""
+        self._attr_is_on = self._value_fn(self._thermostat)
+        self._attr_available = self._thermostat.available
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self.hass.async_add_executor_job(
-            self.entity_description.turn_on_fn, self._thermostat
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_write(self._turn_on_fn)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.hass.async_add_executor_job(
-            self.entity_description.turn_off_fn, self._thermostat
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_write(self._turn_off_fn)
+
+    async def _async_write(self, write_fn: Callable[[TerneoThermostat], bool]) -> None:
+        """Write to the device and publish the new state without polling it."""
+        if await self.hass.async_add_executor_job(write_fn, self._thermostat):
+            self.coordinator.async_publish_state(self._thermostat)
+        else:
+            await self.coordinator.async_request_refresh()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        previous = (self._attr_is_on, self._attr_available)
+        self._update_attrs()
+        # Most values rarely change, skip writing an identical state
+        if (self._attr_is_on, self._attr_available) != previous:
+            self.async_write_ha_state()
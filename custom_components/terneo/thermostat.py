@@ -1,9 +1,14 @@
 """Terneo/Welrok Thermostat API client."""
 import logging
+import sys
+import threading
 import time
-from typing import Any
+from typing import Any, NamedTuple
 
 import requests
+from homeassistant.util.json import json_loads
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .const import (
     ParamNum,
@@ -15,11 +20,53 @@ from .const import (
     CMD_GET_PARAMS,
     CMD_GET_STATUS,
     DEFAULT_TIMEOUT,
+    MIN_REQUEST_INTERVAL,
+    PARAMS_TTL,
+    SENSOR_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _as_float(value: int | None) -> float | None:
+    """Convert an optional number to float."""
+    return None if value is None else float(value)
+
+
+# API strings for boolean parameters, indexed by value
+_BOOL_STR = ("0", "1")
+
+# Parameter value converters by data type, other types stay strings
+_CONVERTERS = {
+    DataType.BOOL: lambda value: value == "1",
+    DataType.INT8: int,
+    DataType.INT16: int,
+    DataType.INT32: int,
+    DataType.UINT8: int,
+    DataType.UINT16: int,
+    DataType.UINT32: int,
+}
+
+
+class ThermostatState(NamedTuple):
+    """Immutable snapshot of the thermostat state taken after an update."""
+
+    power_on: bool | None
+    mode: int | None
+    cooling_mode: bool | None
+    relay_state: bool | None
+    floor_temperature: float | None
+    air_temperature: float | None
+    setpoint: float | None
+    control_type: int | None
+    lower_limit: float | None
+    upper_limit: float | None
+    lower_air_limit: float | None
+    upper_air_limit: float | None
+    hysteresis: float | None
+    power_watts: int | None
+
+
 class TerneoThermostat:
     """
     A class for interacting with the Terneo/Welrok Thermostat's HTTP API.
@@ -49,14 +96,48 @@ class TerneoThermostat:
         self.sn = serial_number
         self.device_type = device_type
         self._is_new_version = device_type == DEVICE_TYPE_NEW
+        self.model = "OZ" if self._is_new_version else "OZ (Legacy)"
+        # New version sends temperatures as °C*10 in 16 bit values
+        self._temp_scale = 10.0 if self._is_new_version else 1.0
+        self._temp_dtype = DataType.INT16 if self._is_new_version else DataType.INT8
+        # Status temperature keys: t.1 floor, t.5 setpoint, t.2 air (new only)
+        self._status_temperatures = (("t.1", "_floor_temperature"), ("t.5", "_setpoint"))
+        if self._is_new_version:
+            self._status_temperatures += (("t.2", "_air_temperature"),)
         self._timeout = timeout
         
-        self._base_url = f"http://{host}/{{endpoint}}.cgi"
-        self._last_request = time.time()
+        self._api_url = f"http://{host}/api.cgi"
+        self._test_url = f"http://{host}/test.cgi"
+        self._index_url = f"http://{host}/api.html"
+        
+        # Keep the connection to the device alive between polls
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            HTTPAdapter(
+                # One device, at most a poll and a write in flight at once
+                pool_connections=1,
+                pool_maxsize=2,
+                # Retry a failed connect once, the next poll retries the rest
+                max_retries=Retry(total=1, connect=1, read=0, status=0),
+            ),
+        )
+        self._next_request = time.monotonic() + MIN_REQUEST_INTERVAL
+        
+        # Entity unique ids, built once per key
+        self._unique_ids: dict[str, str] = {}
         
         # Cached state
         self._available = False
+        self._sensor_type_name: tuple[int | None, str | None] = (None, None)
         self._parameters: dict[int, Any] = {}
+        self._params_fetched_at: float | None = None  # Monotonic time
+        # Without power in the status it is read from the parameters
+        self._status_has_power = False
+        
+        # Parameter writes queued by queue_patch, sent by flush_patch
+        self._pending_params: dict[int, list] = {}
+        self._pending_lock = threading.Lock()
         self._status: dict[str, Any] = {}
         
         # Derived state
@@ -64,53 +145,67 @@ class TerneoThermostat:
         self._floor_temperature: float | None = None
         self._air_temperature: float | None = None
         self._mode: int | None = None
+        self._device_mode: int | None = None  # Last mode, even while off
         self._relay_state: bool | None = None
         self._power_on: bool | None = None
+        self._snapshot: ThermostatState | None = None
         
         # Energy tracking
         self._last_relay_update: float | None = None
         self._heating_energy_kwh: float = 0.0  # Accumulated energy in kWh
         self._heating_time_seconds: float = 0.0  # Accumulated heating time in seconds
-        
-        # Verify connection
+
+    def connect(self) -> None:
+        """Verify the connection to the device."""
         try:
-            r = requests.get(
-                self._base_url.format(endpoint="api.html")[:-4],
+            r = self._session.get(
+                self._index_url,
                 timeout=self._timeout
             )
             if r.status_code == 200:
                 self._available = True
-        except Exception as e:
+        except requests.RequestException as e:
             _LOGGER.error("Connection to Thermostat failed: %s", e)
             raise
 
-    def _get_url(self, endpoint: str) -> str:
-        """Get the full URL for an endpoint."""
-        return self._base_url.format(endpoint=endpoint)
+    def close(self) -> None:
+        """Close the HTTP session."""
+        self._session.close()
+
+    def unique_id(self, key: str) -> str:
+        """Return the interned unique id for an entity key."""
+        unique_id = self._unique_ids.get(key)
+        if unique_id is None:
+            unique_id = self._unique_ids[key] = sys.intern(f"{self.sn}_{key}")
+        return unique_id
 
     def _post(self, endpoint: str = "api", **kwargs) -> dict | bool:
         """Perform a POST request with rate limiting."""
-        kwergs = {}
-        kwergs.update(kwargs)
-
-        # Rate limiting
-        start_time = time.time()
-        if start_time - self._last_request < 1:
-            time.sleep(1)
+        # Rate limiting, only wait out what is left of the interval
+        wait = self._next_request - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
 
+        url = self._api_url if endpoint == "api" else self._test_url
         try:
-            r = requests.post(self._get_url(endpoint), timeout=self._timeout, **kwergs)
-        except Exception as e:
+            r = self._session.post(url, timeout=self._timeout, **kwargs)
+            r.raise_for_status()
+        except requests.HTTPError as e:
+            # The device answered, it just rejected the request
+            self._next_request = time.monotonic() + MIN_REQUEST_INTERVAL
+            _LOGGER.error("POST request rejected: %s", e)
+            return False
+        except requests.RequestException as e:
             self._available = False
-            self._last_request = time.time()
+            self._next_request = time.monotonic() + MIN_REQUEST_INTERVAL
             _LOGGER.error("POST request failed: %s", e)
             return False
         
-        self._last_request = time.time()
+        self._next_request = time.monotonic() + MIN_REQUEST_INTERVAL
         
         try:
-            content = r.json()
-        except Exception as e:
+            content = json_loads(r.content)
+        except ValueError as e:
             _LOGGER.error("Failed to parse JSON response: %s", e)
             return False
 
@@ -125,13 +220,25 @@ class TerneoThermostat:
         """Get all parameters from the device."""
         result = self._post(json={"cmd": CMD_GET_PARAMS, "sn": self.sn})
         if result and "par" in result:
-            self._parameters = {p[0]: (p[1], p[2]) for p in result["par"]}
+            # Update in place, most settings are unchanged between fetches
+            parameters = self._parameters
+            for p in result["par"]:
+                entry = (p[1], p[2])
+                if parameters.get(p[0]) != entry:
+                    parameters[p[0]] = entry
+            self._params_fetched_at = time.monotonic()
             return result
         return False
 
     def set_parameters(self, params: list[list]) -> dict | bool:
         """Set parameters on the device."""
-        return self._post(json={"sn": self.sn, "par": params})
+        result = self._post(json={"sn": self.sn, "par": params})
+        if result:
+            # Keep the cached settings in sync with what was written
+            for param_num, data_type, value in params:
+                self._parameters[param_num] = (data_type, value)
+            self._snapshot = None
+        return result
 
     def get_status(self) -> dict | bool:
         """Get the status dictionary from the thermostat."""
@@ -156,32 +263,24 @@ class TerneoThermostat:
             return self._convert_value(value, data_type)
         return None
 
+    def _scaled_param(self, param_num: int, divisor: float = 10.0) -> float | None:
+        """Get a numeric parameter from cache divided by its scale."""
+        entry = self._parameters.get(param_num)
+        return None if entry is None else int(entry[1]) / divisor
+
     @staticmethod
     def _convert_value(value: str, data_type: int) -> Any:
         """Convert string value to appropriate type."""
-        if data_type == DataType.BOOL:
-            return value == "1"
-        elif data_type in (DataType.INT8, DataType.INT16, DataType.INT32):
-            return int(value)
-        elif data_type in (DataType.UINT8, DataType.UINT16, DataType.UINT32):
-            return int(value)
-        return value
+        converter = _CONVERTERS.get(data_type)
+        return value if converter is None else converter(value)
 
     def _temperature_from_api(self, value: int, param_num: int) -> float:
         """Convert API temperature value to Celsius."""
-        if self._is_new_version:
-            # New version uses °C*10 for most temperature parameters
-            return value / 10.0
-        else:
-            # Old version uses °C directly
-            return float(value)
+        return value / self._temp_scale
 
     def _temperature_to_api(self, value: float, param_num: int) -> str:
         """Convert Celsius to API temperature value."""
-        if self._is_new_version:
-            return str(int(value * 10))
-        else:
-            return str(int(value))
+        return str(int(value * self._temp_scale))
 
     # Properties
 
@@ -233,10 +332,7 @@ class TerneoThermostat:
     @property
     def hysteresis(self) -> float | None:
         """Current hysteresis value in Celsius."""
-        value = self._get_param_value(ParamNum.HYSTERESIS)
-        if value is not None:
-            return value / 10.0
-        return None
+        return self._scaled_param(ParamNum.HYSTERESIS)
 
     @property
     def children_lock(self) -> bool | None:
@@ -318,18 +414,13 @@ class TerneoThermostat:
     @property
     def floor_correction(self) -> float | None:
         """Floor sensor correction in Celsius."""
-        value = self._get_param_value(ParamNum.FLOOR_CORRECTION)
-        if value is not None:
-            return value / 10.0
-        return None
+        return self._scaled_param(ParamNum.FLOOR_CORRECTION)
 
     @property
     def air_correction(self) -> float | None:
         """Air sensor correction in Celsius (new version only)."""
         if self._is_new_version:
-            value = self._get_param_value(ParamNum.AIR_CORRECTION)
-            if value is not None:
-                return value / 10.0
+            return self._scaled_param(ParamNum.AIR_CORRECTION)
         return None
 
     @property
@@ -337,6 +428,21 @@ class TerneoThermostat:
         """Temperature sensor type (resistance)."""
         return self._get_param_value(ParamNum.SENSOR_TYPE)
 
+    @property
+    def sensor_type_name(self) -> str | None:
+        """Temperature sensor type name, cached until the type changes."""
+        sensor_type = self.sensor_type
+        cached_type, name = self._sensor_type_name
+        if sensor_type != cached_type:
+            if sensor_type is None:
+                name = None
+            elif sensor_type in SENSOR_TYPES:
+                name = SENSOR_TYPES[sensor_type]
+            else:
+                name = f"Unknown ({sensor_type})"
+            self._sensor_type_name = (sensor_type, name)
+        return name
+
     @property
     def prop_koef(self) -> int | None:
         """Proportional mode coefficient (minutes of load in 30-min cycle)."""
@@ -472,57 +578,117 @@ class TerneoThermostat:
         temp_value = self._temperature_to_api(temperature, param)
         
         # Turn on, set manual mode, and set temperature
-        result = self.set_parameters([
+        params = [
             [ParamNum.POWER_OFF, DataType.BOOL, "0"],
             [ParamNum.MODE, DataType.UINT8, str(OperationMode.MANUAL)],
-            [param, DataType.INT8 if not self._is_new_version else DataType.INT16, temp_value],
-        ])
+            [param, self._temp_dtype, temp_value],
+        ]
+        result = self.set_parameters(params)
         
         if result:
             self._setpoint = temperature
+            self._apply_local_state(power=True, mode=OperationMode.MANUAL)
         return bool(result)
 
     def set_mode(self, mode: int) -> bool:
         """Set operation mode (0=schedule, 3=manual)."""
-        if mode not in [OperationMode.SCHEDULE, OperationMode.MANUAL]:
-            raise ValueError("Mode must be 0 (schedule) or 3 (manual)")
+        return self.apply_state(power=True, mode=mode)
+
+    def apply_state(
+        self,
+        power: bool | None = None,
+        cooling: bool | None = None,
+        mode: int | None = None,
+    ) -> bool:
+        """Write power, cooling and operation mode in a single request.
         
-        # Map to API values: schedule=0, manual=1 for mode parameter
-        api_mode = 0 if mode == OperationMode.SCHEDULE else 1
+        Only the arguments that are not None are sent to the device.
+        """
+        params = []
         
-        result = self.set_parameters([
-            [ParamNum.POWER_OFF, DataType.BOOL, "0"],
-            [ParamNum.MODE, DataType.UINT8, str(api_mode)],
-        ])
+        if power is not None:
+            params.append([ParamNum.POWER_OFF, DataType.BOOL, _BOOL_STR[not power]])
+        
+        if cooling is not None:
+            params.append(
+                [ParamNum.COOLING_CONTROL_WAY, DataType.BOOL, _BOOL_STR[cooling]]
+            )
+        
+        if mode is not None:
+            if mode not in [OperationMode.SCHEDULE, OperationMode.MANUAL]:
+                raise ValueError("Mode must be 0 (schedule) or 3 (manual)")
+            
+            # Map to API values: schedule=0, manual=1 for mode parameter
+            api_mode = 0 if mode == OperationMode.SCHEDULE else 1
+            params.append([ParamNum.MODE, DataType.UINT8, str(api_mode)])
+        
+        if not params:
+            return True
+        
+        result = self.set_parameters(params)
+        if result:
+            self._apply_local_state(power=power, mode=mode)
         return bool(result)
 
+    def queue_patch(self, param_num: int, data_type: int, value: str) -> bool:
+        """Queue a parameter write to be sent with the next flush_patch."""
+        with self._pending_lock:
+            self._pending_params[param_num] = [param_num, data_type, value]
+        return True
+
+    @property
+    def has_pending_patch(self) -> bool:
+        """Return True if parameter writes are waiting for flush_patch."""
+        return bool(self._pending_params)
+
+    def flush_patch(self) -> bool:
+        """Send all queued parameter writes in a single request."""
+        with self._pending_lock:
+            params = list(self._pending_params.values())
+            self._pending_params.clear()
+        
+        if not params:
+            return True
+        
+        if self.set_parameters(params):
+            return True
+        # Keep the values for the next flush unless they were queued again
+        with self._pending_lock:
+            for param in params:
+                self._pending_params.setdefault(param[0], param)
+        return False
+
+    def _set_flag(self, param_num: int, enabled: bool) -> bool:
+        """Write a boolean parameter."""
+        return bool(self.set_parameters([[param_num, DataType.BOOL, _BOOL_STR[enabled]]]))
+
+    def _apply_local_state(
+        self, power: bool | None = None, mode: int | None = None
+    ) -> None:
+        """Update derived state after a successful write."""
+        if power is not None:
+            self._power_on = power
+        if mode is not None:
+            self._device_mode = int(mode)
+        if self._device_mode is not None:
+            self._mode = self._device_mode if self._power_on else -1
+        self._snapshot = None
+
     def turn_on(self) -> bool:
         """Turn on the thermostat."""
-        result = self.set_parameters([[ParamNum.POWER_OFF, DataType.BOOL, "0"]])
-        if result:
-            self._power_on = True
-        return bool(result)
+        return self.apply_state(power=True)
 
     def turn_off(self) -> bool:
         """Turn off the thermostat."""
-        result = self.set_parameters([[ParamNum.POWER_OFF, DataType.BOOL, "1"]])
-        if result:
-            self._power_on = False
-        return bool(result)
+        return self.apply_state(power=False)
 
     def set_children_lock(self, enabled: bool) -> bool:
         """Set children lock."""
-        result = self.set_parameters([
-            [ParamNum.CHILDREN_LOCK, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.CHILDREN_LOCK, enabled)
 
     def set_cooling_mode(self, enabled: bool) -> bool:
         """Set cooling mode (vs heating)."""
-        result = self.set_parameters([
-            [ParamNum.COOLING_CONTROL_WAY, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.COOLING_CONTROL_WAY, enabled)
 
     def set_control_type(self, control_type: int) -> bool:
         """Set control type (0=floor, 1=air, 2=air with floor limit)."""
@@ -554,10 +720,7 @@ class TerneoThermostat:
 
     def set_pre_control(self, enabled: bool) -> bool:
         """Set pre-heating mode."""
-        result = self.set_parameters([
-            [ParamNum.PRE_CONTROL, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.PRE_CONTROL, enabled)
 
     def set_window_open_control(self, enabled: bool) -> bool:
         """Set window open detection (new version only)."""
@@ -565,25 +728,19 @@ class TerneoThermostat:
             _LOGGER.warning("Window open control is only available on new version")
             return False
         
-        result = self.set_parameters([
-            [ParamNum.WINDOW_OPEN_CONTROL, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.WINDOW_OPEN_CONTROL, enabled)
 
     def set_use_night_brightness(self, enabled: bool) -> bool:
         """Set night brightness mode."""
-        result = self.set_parameters([
-            [ParamNum.USE_NIGHT_BRIGHT, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.USE_NIGHT_BRIGHT, enabled)
 
     def set_floor_limits(self, lower: int, upper: int) -> bool:
         """Set floor temperature limits."""
-        result = self.set_parameters([
+        params = [
             [ParamNum.LOWER_LIMIT, DataType.INT8, str(lower)],
             [ParamNum.UPPER_LIMIT, DataType.INT8, str(upper)],
-        ])
-        return bool(result)
+        ]
+        return bool(self.set_parameters(params))
 
     def set_air_limits(self, lower: int, upper: int) -> bool:
         """Set air temperature limits (new version only)."""
@@ -591,11 +748,11 @@ class TerneoThermostat:
             _LOGGER.warning("Air limits are only available on new version")
             return False
         
-        result = self.set_parameters([
+        params = [
             [ParamNum.LOWER_AIR_LIMIT, DataType.INT8, str(lower)],
             [ParamNum.UPPER_AIR_LIMIT, DataType.INT8, str(upper)],
-        ])
-        return bool(result)
+        ]
+        return bool(self.set_parameters(params))
 
     def set_sensor_type(self, sensor_type: int) -> bool:
         """Set temperature sensor type (0-6)."""
@@ -619,10 +776,7 @@ class TerneoThermostat:
 
     def set_nc_contact_control(self, enabled: bool) -> bool:
         """Set relay inversion (NC mode)."""
-        result = self.set_parameters([
-            [ParamNum.NC_CONTACT_CONTROL, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.NC_CONTACT_CONTROL, enabled)
 
     def set_night_brightness_time(self, start_minutes: int, end_minutes: int) -> bool:
         """Set night brightness time range (minutes from 00:00)."""
@@ -676,17 +830,11 @@ class TerneoThermostat:
 
     def set_lan_block(self, enabled: bool) -> bool:
         """Set LAN API block."""
-        result = self.set_parameters([
-            [ParamNum.LAN_BLOCK, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.LAN_BLOCK, enabled)
 
     def set_cloud_block(self, enabled: bool) -> bool:
         """Set cloud block."""
-        result = self.set_parameters([
-            [ParamNum.CLOUD_BLOCK, DataType.BOOL, "1" if enabled else "0"]
-        ])
-        return bool(result)
+        return self._set_flag(ParamNum.CLOUD_BLOCK, enabled)
 
     def set_advanced_floor_limits(self, min_temp: int, max_temp: int) -> bool:
         """Set floor temp limits for air control mode (new version only)."""
@@ -730,7 +878,7 @@ class TerneoThermostat:
         """Set away mode temperatures."""
         params = [
             [ParamNum.AWAY_FLOOR, 
-             DataType.INT8 if not self._is_new_version else DataType.INT16, 
+             self._temp_dtype, 
              self._temperature_to_api(floor_temp, ParamNum.AWAY_FLOOR)]
         ]
         
@@ -759,9 +907,13 @@ class TerneoThermostat:
 
     def update(self) -> bool:
         """Update all state from device."""
-        # Get parameters
-        params_result = self.get_parameters()
-        if not params_result:
+        # Settings rarely change, only fetch them once they are stale. Devices
+        # not reporting power in the status need them on every update.
+        if (
+            not self._status_has_power
+            or self._params_fetched_at is None
+            or time.monotonic() - self._params_fetched_at > PARAMS_TTL
+        ) and not self.get_parameters():
             return False
         
         # Get status
@@ -771,36 +923,61 @@ class TerneoThermostat:
         
         # Parse status
         self._parse_status(status_result)
-        
-        # Update power state from parameters
-        self._power_on = not self._get_param_value(ParamNum.POWER_OFF)
+        self._snapshot = self._build_snapshot()
         
         return True
 
+    def snapshot(self) -> ThermostatState:
+        """Return the current state as an immutable snapshot.
+        
+        The snapshot is built once per update and rebuilt only after a
+        write changed the local state.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self._build_snapshot()
+        return snapshot
+
+    def _build_snapshot(self) -> ThermostatState:
+        """Build a snapshot from the current state."""
+        return ThermostatState(
+            power_on=self._power_on,
+            mode=self._mode,
+            cooling_mode=self.cooling_mode,
+            relay_state=self._relay_state,
+            floor_temperature=self._floor_temperature,
+            air_temperature=self._air_temperature,
+            setpoint=self._setpoint,
+            control_type=self.control_type,
+            lower_limit=_as_float(self.lower_limit),
+            upper_limit=_as_float(self.upper_limit),
+            lower_air_limit=_as_float(self.lower_air_limit),
+            upper_air_limit=_as_float(self.upper_air_limit),
+            hysteresis=self.hysteresis,
+            power_watts=self.power_watts,
+        )
+
     def _parse_status(self, data: dict) -> None:
         """Parse status response."""
-        # Floor temperature (t.1 = raw * 16)
-        if "t.1" in data:
-            self._floor_temperature = float(data["t.1"]) / 16.0
-        
-        # Air temperature (t.2 for new version)
-        if self._is_new_version and "t.2" in data:
-            self._air_temperature = float(data["t.2"]) / 16.0
+        # Temperatures (raw * 16)
+        for key, attr in self._status_temperatures:
+            value = data.get(key)
+            if value is not None:
+                setattr(self, attr, float(value) * 0.0625)
         
-        # Setpoint (t.5 = raw * 16)
-        if "t.5" in data:
-            self._setpoint = float(data["t.5"]) / 16.0
+        # Power state, from the parameters fetched with this update if the
+        # status does not report it
+        self._status_has_power = "f.16" in data
+        if self._status_has_power:
+            self._power_on = int(data["f.16"]) == 0
+        else:
+            self._power_on = not self._get_param_value(ParamNum.POWER_OFF)
         
         # Mode
         if "m.1" in data:
             mode_value = int(data["m.1"])
-            # Check power state
-            if "f.16" in data:
-                is_on = int(data["f.16"]) == 0
-            else:
-                is_on = not self._get_param_value(ParamNum.POWER_OFF)
-            
-            if not is_on:
+            self._device_mode = mode_value
+            if not self._power_on:
                 self._mode = -1  # Off
             else:
                 self._mode = mode_value
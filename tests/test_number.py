@@ -0,0 +1,109 @@
+"""Tests for the coalesced parameter writes of the number platform."""
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.terneo.number import PatchWriter  # noqa: E402
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for PatchWriter."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+    def async_create_task(self, coro):
+        return self.loop.create_task(coro)
+
+
+class FakeCoordinator:
+    def __init__(self) -> None:
+        self.published = []
+        self.refreshes = 0
+
+    def async_publish_state(self, thermostat) -> None:
+        self.published.append(thermostat.snapshot())
+
+    async def async_request_refresh(self) -> None:
+        self.refreshes += 1
+
+
+class BlockingThermostat:
+    """Thermostat whose first flush blocks until released."""
+
+    def __init__(self) -> None:
+        self.pending = {}
+        self.batches = []
+        self.flush_started = threading.Event()
+        self.release = threading.Event()
+
+    def queue_patch(self, param_num, param_type, value) -> None:
+        self.pending[param_num] = [param_num, param_type, value]
+
+    @property
+    def has_pending_patch(self) -> bool:
+        return bool(self.pending)
+
+    def flush_patch(self) -> bool:
+        params, self.pending = list(self.pending.values()), {}
+        self.batches.append(params)
+        if not self.flush_started.is_set():
+            self.flush_started.set()
+            self.release.wait(5)
+        return True
+
+    def snapshot(self):
+        return object()
+
+
+def test_write_queued_during_flush_is_sent():
+    """A write arriving while a flush runs goes out with a second flush."""
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        thermostat = BlockingThermostat()
+        coordinator = FakeCoordinator()
+        writer = PatchWriter(FakeHass(loop), coordinator, thermostat)
+
+        thermostat.queue_patch(1, 2, "10")
+        first = asyncio.create_task(writer.async_write())
+        await loop.run_in_executor(None, thermostat.flush_started.wait, 5)
+
+        thermostat.queue_patch(2, 2, "20")
+        second = asyncio.create_task(writer.async_write())
+        await asyncio.sleep(0)
+        thermostat.release.set()
+
+        await asyncio.wait_for(asyncio.gather(first, second), 5)
+        assert thermostat.batches == [[[1, 2, "10"]], [[2, 2, "20"]]]
+        assert len(coordinator.published) == 2
+        assert coordinator.refreshes == 0
+
+    asyncio.run(run())
+
+
+def test_shutdown_sends_queued_writes_once():
+    """Unloading flushes pending writes without waiting for the timer."""
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        thermostat = BlockingThermostat()
+        thermostat.flush_started.set()
+        writer = PatchWriter(FakeHass(loop), FakeCoordinator(), thermostat)
+
+        thermostat.queue_patch(1, 2, "10")
+        write = asyncio.create_task(writer.async_write())
+        await asyncio.sleep(0)
+        await writer.async_shutdown()
+        await writer.async_shutdown()
+
+        await asyncio.wait_for(write, 5)
+        assert thermostat.batches == [[[1, 2, "10"]]]
+
+    asyncio.run(run())